@@ -2,20 +2,43 @@
 
 from __future__ import annotations
 
+import json
+import os
+import sys
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from multiprocessing import Pool
 from pathlib import Path
-from typing import Optional, cast
+from typing import Optional
 
-import rmm.util as util
 from rmm.exception import InvalidPackageHash
 
 DEBUG = False
 
+ABOUT_TEXT_TAGS = frozenset(["packageId", "author", "name"])
+ABOUT_LIST_TAGS = frozenset(
+    ["loadAfter", "loadBefore", "incompatibleWith", "supportedVersions", "authors"]
+)
+
 
 @dataclass
 class Mod:
+    __slots__ = (
+        "packageid",
+        "before",
+        "after",
+        "incompatible",
+        "dirname",
+        "author",
+        "name",
+        "ignored",
+        "steamid",
+        "versions",
+        "repo_url",
+        "workshop_managed",
+        "enabled",
+    )
+
     def __init__(
         self,
         packageid: Optional[str] = None,
@@ -33,7 +56,7 @@ class Mod:
         enabled: Optional[bool] = None,
     ):
         if packageid and isinstance(packageid, str):
-            self.packageid = packageid.lower()
+            self.packageid = sys.intern(packageid.lower())
         else:
             self.packageid = packageid
         self.before = Mod.lowercase_set(before)
@@ -58,7 +81,7 @@ class Mod:
         try:
             for n in data:
                 try:
-                    retval.add(n.lower())
+                    retval.add(sys.intern(n.lower()))
                 except AttributeError:
                     continue
         except TypeError:
@@ -70,56 +93,103 @@ class Mod:
         return Mod(steamid=wr.steamid, name=wr.name, author=wr.author)
 
     @staticmethod
-    def create_from_path(path) -> Optional[Mod]:
+    def read_about(path: Path) -> dict:
+        # Parse About.xml from memory in C and look at the direct children of
+        # the root once, keeping only the tags Mod cares about.
+        root = ET.fromstring(path.read_bytes())
+
+        def text(elem) -> Optional[str]:
+            # Package ids, authors and versions repeat across mods, interning
+            # them shares one string and makes comparisons identity checks.
+            return sys.intern(elem.text) if elem.text else None
+
+        about = dict()
+        for child in root:
+            if child.tag in ABOUT_LIST_TAGS:
+                about.setdefault(child.tag, [text(n) for n in child.iterfind("li")])
+            elif child.tag in ABOUT_TEXT_TAGS:
+                about.setdefault(child.tag, text(child))
+        return about
+
+    @staticmethod
+    def scan_dir(path: Path) -> dict[str, os.DirEntry]:
+        # Keys are lowercased to keep lookups working on case-insensitive
+        # filesystems.
+        with os.scandir(path) as it:
+            return {entry.name.lower(): entry for entry in it}
+
+    @staticmethod
+    def list_files(
+        path: Path,
+    ) -> tuple[dict[str, os.DirEntry], dict[str, os.DirEntry]]:
+        # One listing of the mod directory and one of About/ answer every
+        # lookup made while reading a mod.
+        entries = Mod.scan_dir(path)
+        if "about" not in entries:
+            raise FileNotFoundError(path / "About")
+        about_entries = Mod.scan_dir(entries["about"].path)
+        if "about.xml" not in about_entries:
+            raise FileNotFoundError(path / "About/About.xml")
+        return (entries, about_entries)
+
+    @staticmethod
+    def create_from_path(
+        path,
+        listing: Optional[tuple[dict[str, os.DirEntry], dict[str, os.DirEntry]]] = None,
+    ) -> Optional[Mod]:
         try:
-            tree = ET.parse(path / "About/About.xml")
-            root = tree.getroot()
-            try:
-                packageid = cast(str, cast(ET.Element, root.find("packageId")).text)
-            except AttributeError as e:
-                name = util.element_grab("name", root)
-                author = util.element_grab("author", root)
-                if name and author:
-                    packageid = "{}.{}".format(name.lower(), author.lower())
+            entries, about_entries = listing or Mod.list_files(path)
+            about = Mod.read_about(Path(about_entries["about.xml"].path))
+            author = about.get("author")
+            if not author and about.get("authors"):
+                author = ", ".join(about["authors"])
+
+            if "packageId" in about:
+                packageid = about["packageId"]
+            else:
+                name = about.get("name")
+                if name and about.get("author"):
+                    packageid = "{}.{}".format(name.lower(), about["author"].lower())
                 else:
                     if DEBUG:
-                        raise e
+                        raise AttributeError(f"No packageId in {path}")
                     return None
 
-            def read_steamid(path: Path) -> Optional[int]:
+            def read_steamid() -> Optional[int]:
+                if "publishedfileid.txt" not in about_entries:
+                    return None
                 try:
                     return int(
-                        (path / "About" / "PublishedFileId.txt")
-                        .read_text()
+                        Path(about_entries["publishedfileid.txt"].path)
+                        .read_bytes()
+                        .decode("ascii", errors="ignore")
                         .strip()
-                        .encode("ascii", errors="ignore")
-                        .decode()
                     )
                 except (OSError, ValueError, IOError) as e:
                     if DEBUG:
                         print(e)
                     return None
 
-            def read_ignored(path: Path):
+            def read_ignored() -> bool:
+                if ".rmm_ignore" not in entries:
+                    return False
                 try:
-                    return (path / ".rmm_ignore").is_file()
+                    return entries[".rmm_ignore"].is_file()
                 except OSError as e:
                     print(e)
                     return False
 
             return Mod(
                 packageid=packageid,
-                before=util.list_grab("loadAfter", root),
-                after=util.list_grab("loadBefore", root),
-                incompatible=util.list_grab("incompatibleWith", root),
+                before=about.get("loadAfter"),
+                after=about.get("loadBefore"),
+                incompatible=about.get("incompatibleWith"),
                 dirname=path.name,
-                author=util.element_grab("author", root)
-                if util.element_grab("author", root)
-                else ", ".join(util.list_grab("authors", root)),
-                name=util.element_grab("name", root),
-                versions=util.list_grab("supportedVersions", root),
-                steamid=read_steamid(path),
-                ignored=read_ignored(path),
+                author=author,
+                name=about.get("name"),
+                versions=about.get("supportedVersions"),
+                steamid=read_steamid(),
+                ignored=read_ignored(),
             )
 
         except OSError:
@@ -152,6 +222,21 @@ class Mod:
     def __str__(self):
         return f"<Mod: '{self.packageid}'>"
 
+    def to_dict(self) -> dict:
+        # Keyword arguments for Mod(), used for the ModFolder cache.
+        return {
+            "packageid": self.packageid,
+            "before": sorted(self.before) if self.before is not None else None,
+            "after": sorted(self.after) if self.after is not None else None,
+            "incompatible": self.incompatible,
+            "dirname": self.dirname,
+            "author": self.author,
+            "name": self.name,
+            "versions": self.versions,
+            "steamid": self.steamid,
+            "ignored": self.ignored,
+        }
+
     @staticmethod
     def list_to_dict(mods: list[Mod]):
         hm = dict()
@@ -164,22 +249,118 @@ class Mod:
 
 
 class ModFolder:
+    # Reading mods is dominated by small file reads, so threads are enough and
+    # the pool is kept around between reads.
+    executor = ThreadPoolExecutor(max_workers=16)
+
+    cache_path = (
+        Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser()
+        / "rmm"
+        / "mods.json"
+    )
+    # Bump whenever parsing or the cached fields change, older caches are
+    # discarded.
+    CACHE_VERSION = 1
+
     @staticmethod
-    def read(path: Path) -> list[Mod]:
-        with Pool(16) as p:
-            mods = cast(
-                list[Mod],
-                list(
-                    filter(
-                        None,
-                        p.map(
-                            Mod.create_from_path,
-                            path.iterdir(),
-                        ),
-                    )
-                ),
+    def signature(
+        entry: os.DirEntry,
+        entries: dict[str, os.DirEntry],
+        about_entries: dict[str, os.DirEntry],
+    ) -> list[Optional[int]]:
+        # Modification times of every file Mod.create_from_path reads, taken
+        # from the listings it is given. Optional files count as None when
+        # they are absent.
+        def mtime(e: Optional[os.DirEntry]) -> Optional[int]:
+            return e.stat().st_mtime_ns if e else None
+
+        return [
+            mtime(entry),
+            mtime(entries["about"]),
+            mtime(about_entries["about.xml"]),
+            mtime(about_entries.get("publishedfileid.txt")),
+            mtime(entries.get(".rmm_ignore")),
+        ]
+
+    @classmethod
+    def read_cache(cls) -> dict:
+        try:
+            with cls.cache_path.open("r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return dict()
+        if not isinstance(cache, dict) or cache.get("version") != cls.CACHE_VERSION:
+            return dict()
+        return cache.get("folders", dict())
+
+    @classmethod
+    def write_cache(cls, folders: dict):
+        try:
+            cls.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with cls.cache_path.open("w", encoding="utf-8") as f:
+                json.dump({"version": cls.CACHE_VERSION, "folders": folders}, f)
+        except OSError as e:
+            if DEBUG:
+                print(e)
+
+    @staticmethod
+    def read_mod(
+        entry: os.DirEntry, cached: dict
+    ) -> tuple[Optional[list[Optional[int]]], Optional[Mod]]:
+        path = Path(entry.path)
+        try:
+            listing = Mod.list_files(path)
+            signature = ModFolder.signature(entry, *listing)
+        except OSError:
+            # Let create_from_path report the broken folder.
+            return (None, Mod.create_from_path(path))
+
+        hit = cached.get(entry.name)
+        if hit and hit.get("signature") == signature:
+            try:
+                return (signature, Mod(**hit["mod"]))
+            except (KeyError, TypeError):
+                pass
+        return (signature, Mod.create_from_path(path, listing))
+
+    @classmethod
+    def read(cls, path: Path, use_cache: bool = True) -> list[Mod]:
+        with os.scandir(path) as it:
+            dirs = [entry for entry in it if entry.is_dir()]
+
+        if not use_cache:
+            return list(
+                filter(
+                    None,
+                    cls.executor.map(
+                        Mod.create_from_path, [Path(d.path) for d in dirs]
+                    ),
+                )
             )
 
+        # Mod folders rarely change, so parsed mods are cached by the
+        # modification times of the files they are read from. Folders that
+        # no longer exist are dropped.
+        stored = cls.read_cache()
+        cache = {k: v for k, v in stored.items() if os.path.isdir(k)}
+        key = os.path.abspath(path)
+        cached = cache.get(key, dict())
+
+        mods = []
+        updated = dict()
+        for d, (signature, mod) in zip(
+            dirs, cls.executor.map(cls.read_mod, dirs, [cached] * len(dirs))
+        ):
+            if not mod:
+                continue
+            mods.append(mod)
+            if signature:
+                updated[d.name] = {"signature": signature, "mod": mod.to_dict()}
+
+        cache[key] = updated
+        if cache != stored:
+            cls.write_cache(cache)
+
         return mods
 
     @staticmethod
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import csv
+import io
 import re
 from abc import ABC, abstractmethod
 from collections.abc import MutableSequence
 from pathlib import Path
-from typing import Any, Generator, Iterator, cast
+from typing import Generator, TextIO, cast
 
 from rmm.mod import Mod
 
@@ -23,19 +24,9 @@ class ModListSerializer(ABC):
     def serialize(cls, mods: MutableSequence) -> Generator[str, None, None]:
         pass
 
-
-class CsvStringBuilder:
-    def __init__(self):
-        self.value = []
-
-    def write(self, row: str) -> None:
-        self.value.append(row)
-
-    def pop(self) -> None:
-        return self.value.pop()
-
-    def __iter__(self) -> Iterator[str]:
-        return iter(self.value)
+    @classmethod
+    def write(cls, mods: MutableSequence, out: TextIO) -> None:
+        out.writelines(line + "\n" for line in cls.serialize(mods))
 
 
 class ModListV2Format(ModListSerializer):
@@ -44,13 +35,13 @@ class ModListV2Format(ModListSerializer):
 
     @classmethod
     def parse(cls, text: str) -> Generator[Mod, None, None]:
-        reader = csv.reader(text.split("\n"))
+        reader = csv.reader(io.StringIO(text))
         for parsed in reader:
             try:
                 yield Mod(
                     packageid=parsed[cls.HEADER["PACKAGE_ID"]],
                     steamid=int(parsed[cls.HEADER["STEAM_ID"]]),
-                    repo_url=parsed[cls.HEADER["REPO_URL"]] if not "" else None,
+                    repo_url=parsed[cls.HEADER["REPO_URL"]] or None,
                 )
             except IndexError:
                 if parsed:
@@ -59,27 +50,30 @@ class ModListV2Format(ModListSerializer):
             except ValueError:
                 yield Mod(
                     packageid=parsed[cls.HEADER["PACKAGE_ID"]],
-                    repo_url=parsed[cls.HEADER["REPO_URL"]] if not "" else None,
+                    repo_url=parsed[cls.HEADER["REPO_URL"]] or None,
                 )
                 continue
 
     @classmethod
     def serialize(cls, mods: MutableSequence) -> Generator[str, None, None]:
-        buffer = CsvStringBuilder()
-        writer = csv.writer(cast(Any, buffer))
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="")
         for m in mods:
             writer.writerow(cls.format(m))
-            yield buffer.pop().strip()
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    @classmethod
+    def write(cls, mods: MutableSequence, out: TextIO) -> None:
+        csv.writer(out, lineterminator="\n").writerows(map(cls.format, mods))
 
     @classmethod
-    def format(cls, mod: Mod) -> list[str]:
-        return cast(
-            list[str],
-            [
-                mod.packageid,
-                str(mod.steamid) if not None else "",
-                mod.repo_url if not None else "",
-            ],
+    def format(cls, mod: Mod) -> tuple[str, str, str]:
+        return (
+            cast(str, mod.packageid),
+            str(mod.steamid) if mod.steamid is not None else "",
+            mod.repo_url or "",
         )
 
 
@@ -121,7 +115,7 @@ class ModListV1Format(ModListSerializer):
 
     @classmethod
     def format(cls, mod: Mod) -> str:
-        return "{}# {} by {} ".format(str(mod.steamid), mod.name, mod.author)
+        return f"{mod.steamid}# {mod.name} by {mod.author} "
 
 
 class ModListFile:
@@ -135,15 +129,15 @@ class ModListFile:
             return None
 
         if re.search(r"^\s?[0-9]+\s?#.*$", text, re.MULTILINE):
-            return [m for m in ModListV1Format.parse(text)]
+            return list(ModListV1Format.parse(text))
 
-        return [m for m in ModListV2Format.parse(text)]
+        return list(ModListV2Format.parse(text))
 
     @staticmethod
     def write(path: Path, mods: MutableSequence, serializer: ModListSerializer) -> bool:
         try:
-            with path.open("w+") as f:
-                [f.write(line + "\n") for line in serializer.serialize(mods)]
+            with path.open("w", buffering=1 << 20) as f:
+                serializer.write(mods, f)
         except OSError as e:
             print(e)
             return False
@@ -3,7 +3,6 @@
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import List, cast
-from xml.etree import ElementTree as ET
 
 import rmm.util as util
 from rmm.mod import EXPANSION_PACKAGES, Mod
@@ -15,12 +14,16 @@ class ModsConfig:
             p = Path(p)
         self.path = p.expanduser()
         try:
-            self.element_tree = ET.parse(self.path)
+            data = self.path.read_bytes()
         except OSError:
             print("Unable to read ModsConfig file at " + str(self.path))
             raise
 
-        self.root = self.element_tree.getroot()
+        # Feed the bytes straight to the C parser, the ElementTree wrapper
+        # returned by ET.parse is never needed.
+        parser = ET.XMLParser(target=ET.TreeBuilder())
+        parser.feed(data)
+        self.root = parser.close()
         try:
             enabled = cast(
                 List[str],
@@ -96,9 +99,11 @@ class ModsConfig:
             if not pid in self.mods:
                 del combined_load_order[n]
 
-        for k in range(0, len(combined_load_order)):
-            for j in range(k + 1, len(combined_load_order)):
-                DG.add_edge(combined_load_order[j], combined_load_order[k])
+        edges = [
+            (combined_load_order[j], combined_load_order[k])
+            for k in range(0, len(combined_load_order))
+            for j in range(k + 1, len(combined_load_order))
+        ]
 
         populated_mods = {m.packageid: m for m in mods if m in self.mods}
 
@@ -147,28 +152,26 @@ class ModsConfig:
             "murmur.walllight" in populated_mods
             and "juanlopez2008.lightsout" in populated_mods
         ):
-            DG.add_edge("juanlopez2008.lightsout", "murmur.walllight")
+            edges.append(("juanlopez2008.lightsout", "murmur.walllight"))
 
+        installed = {m.packageid for m in EXPANSION_PACKAGES + mods}
         mods_for_removal = {
             n
             for n in expansion_load_order + before_core
-            if n not in EXPANSION_PACKAGES + mods or n not in self.mods
+            if n not in installed or n not in self.mods
         }
 
+        load_order = set(combined_load_order)
         for pid, m in populated_mods.items():
             if rocketman and pid != "krkr.rocketman":
-                DG.add_edge("krkr.rocketman", pid)
-            if not m in combined_load_order:
-                for n in combined_load_order:
-                    DG.add_edge(pid, n)
+                edges.append(("krkr.rocketman", pid))
+            if pid not in load_order:
+                edges.extend((pid, n) for n in combined_load_order)
             if m.after:
-                for a in m.after:
-                    if a in self.mods:
-                        DG.add_edge(a.lower(), pid)
+                edges.extend((a.lower(), pid) for a in m.after if a in self.mods)
             if m.before:
-                for b in m.before:
-                    if b in self.mods:
-                        DG.add_edge(pid, b.lower())
+                edges.extend((pid, b.lower()) for b in m.before if b in self.mods)
+        DG.add_edges_from(edges)
 
         count = 0
         while True:
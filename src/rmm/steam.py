@@ -1,22 +1,37 @@
 #!/usr/bin/env python3
 
+from __future__ import annotations
+
 import os
 import re
 import subprocess
+import sys
 import tempfile
+import threading
 import urllib.error
+import urllib.parse
 import urllib.request
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Tuple
 
-from bs4 import BeautifulSoup
+import requests
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
 
 import rmm.util as util
 from rmm.mod import Mod, ModFolder
 
 STEAMCMD_WINDOWS_URL = "https://steamcdn-a.akamaihd.net/client/installer/steamcmd.zip"
 
+RATING_EXP = re.compile("([1-5])(?:-star)")
+STEAMID_EXP = re.compile(r"\d+")
+
+# Upper bound on concurrent detail requests, also the size of the HTTP
+# connection pool so every thread gets a kept-alive connection.
+MAX_CONNECTIONS = 20
+
 
 class SteamDownloader:
     @staticmethod
@@ -38,7 +53,7 @@ class SteamDownloader:
 
         os.chdir(path)
         try:
-            for n in util.execute("steamcmd +login anonymous +quit"):
+            for n in util.execute(["steamcmd", "+login", "anonymous", "+quit"]):
                 print(n, end="")
         except subprocess.CalledProcessError:
             pass
@@ -85,30 +100,30 @@ class SteamDownloader:
         if not home_path:
             raise Exception("Error could not get temporary directory")
 
-        workshop_item_arg = " +workshop_download_item 294100 "
+        query = ["steamcmd", "+login", "anonymous"]
+        for m in mods:
+            query += ["+workshop_download_item", "294100", str(m)]
+        query.append("+quit")
+
         if util.platform() == "win32":
             os.chdir(home_path)
             if not (home_path / "steamcmd.exe").exists():
                 SteamDownloader.download_steamcmd_windows(home_path)
 
-            query = "steamcmd +login anonymous {} +quit".format(
-                workshop_item_arg + workshop_item_arg.join(str(m) for m in mods),
-            )
             print()
             for n in util.execute(query):
                 print(n, end="")
         else:
-            query = 'env HOME="{}" steamcmd +login anonymous {} +quit >&2'.format(
-                str(home_path),
-                workshop_item_arg + workshop_item_arg.join(str(m) for m in mods),
-            )
-            util.run_sh(query)
+            env = dict(os.environ, HOME=str(home_path))
+            for n in util.execute(query, env=env):
+                print(n, end="", file=sys.stderr)
 
         # TODO: ugly work around for weird steam problem
         if util.platform() == "linux" and not mod_path.exists():
             mod_path = SteamDownloader.replace_path(mod_path)
 
-        return (ModFolder.read(mod_path), mod_path)
+        # The download folder is temporary, keep it out of the mod cache.
+        return (ModFolder.read(mod_path, use_cache=False), mod_path)
 
     @staticmethod
     def replace_path(path):
@@ -125,6 +140,18 @@ class SteamDownloader:
 
 
 class WorkshopResult:
+    __slots__ = (
+        "steamid",
+        "name",
+        "author",
+        "description",
+        "update_time",
+        "size",
+        "create_time",
+        "num_ratings",
+        "rating",
+    )
+
     def __init__(
         self,
         steamid,
@@ -152,8 +179,8 @@ class WorkshopResult:
         return "\n".join(
             [
                 prop + ": " + str(getattr(self, prop))
-                for prop in self.__dict__
-                if not callable(self.__dict__[prop])
+                for prop in self.__slots__
+                if not callable(getattr(self, prop))
             ]
         )
 
@@ -165,6 +192,18 @@ class WorkshopResult:
             raise NotImplementedError
         return self.steamid == other.steamid
 
+    def _merge(self, other: WorkshopResult):
+        if not isinstance(other, WorkshopResult):
+            raise NotImplementedError
+        for prop in self.__slots__:
+            value = getattr(other, prop)
+            if value is not None:
+                setattr(self, prop, value)
+
+    def get_details(self) -> WorkshopResult:
+        self._merge(WorkshopWebScraper.detail(self.steamid))
+        return self
+
 
 class WorkshopWebScraper:
     headers = {
@@ -175,58 +214,70 @@ class WorkshopWebScraper:
     )
     detail_query = "https://steamcommunity.com/sharedfiles/filedetails/?id={}"
 
+    # requests.Session is not documented as thread-safe, so every thread
+    # gets its own. They all mount one adapter, whose urllib3 connection
+    # pool is thread-safe and keeps connections to steamcommunity.com alive
+    # across threads, sized for the threads used by detail_batch.
+    adapter = HTTPAdapter(pool_maxsize=MAX_CONNECTIONS)
+    local = threading.local()
+
+    @classmethod
+    def session(cls) -> requests.Session:
+        session = getattr(cls.local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(cls.headers)
+            session.mount("https://", cls.adapter)
+            cls.local.session = session
+        return session
+
     @classmethod
-    def _request(cls, url: str, term: str):
+    def _request(cls, url: str, term: str) -> requests.Response:
         max_retries = 5
         for n in range(max_retries + 1):
             try:
-                return urllib.request.urlopen(
-                    urllib.request.Request(
-                        url.format(term.replace(" ", "+")),
-                        headers=WorkshopWebScraper.headers,
-                    )
+                response = cls.session().get(
+                    url.format(urllib.parse.quote_plus(term)), timeout=10
                 )
-            except urllib.error.URLError as e:
+                response.raise_for_status()
+                return response
+            except requests.RequestException as e:
                 if n < max_retries:
                     continue
                 raise e
 
     @classmethod
     def detail(cls, steamid: int) -> WorkshopResult:
-        results = BeautifulSoup(
-            cls._request(cls.detail_query, str(steamid)),
-            "html.parser",
-        )
+        results = LexborHTMLParser(cls._request(cls.detail_query, str(steamid)).content)
 
-        details = results.find_all("div", class_="detailsStatRight")
+        details = results.css("div.detailsStatRight")
         try:
-            size = details[0].get_text()
+            size = details[0].text()
         except IndexError:
             size = None
         try:
-            created = details[1].get_text()
+            created = details[1].text()
         except IndexError:
             created = None
         try:
-            updated = details[2].get_text()
+            updated = details[2].text()
         except IndexError:
             updated = None
         try:
-            description = results.find("div", class_="workshopItemDescription")
+            description = results.css_first("div.workshopItemDescription")
             if description:
-                description = description.get_text()
+                description = description.text()
         except AttributeError:
             description = None
         try:
-            num_ratings = results.find("div", class_="numRatings")
+            num_ratings = results.css_first("div.numRatings")
             if num_ratings:
-                num_ratings = num_ratings.get_text()
+                num_ratings = num_ratings.text()
         except AttributeError:
             num_ratings = None
         try:
-            rating = re.search(
-                "([1-5])(?:-star)",
-                str(results.find("div", class_="fileRatingDetails").img),
+            rating = RATING_EXP.search(
+                results.css_first("div.fileRatingDetails img").html
             )
             if rating:
                 rating = rating.group(1)
@@ -243,22 +294,40 @@ class WorkshopWebScraper:
             rating=rating,
         )
 
+    @classmethod
+    def detail_batch(
+        cls, results: List[WorkshopResult], concurrency: int = MAX_CONNECTIONS
+    ) -> List[WorkshopResult]:
+        # Detail pages are fetched concurrently, each request is dominated by
+        # network latency. More threads than pooled connections would only
+        # churn connections.
+        concurrency = max(1, min(concurrency, MAX_CONNECTIONS))
+
+        # A failed lookup leaves that result as it was instead of aborting
+        # the whole batch.
+        def fetch(result: WorkshopResult) -> WorkshopResult:
+            try:
+                return result.get_details()
+            except requests.RequestException as e:
+                print(f"Unable to fetch details for {result.steamid}: {e}")
+                return result
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(fetch, results))
+
     @classmethod
     def search(cls, term: str, reverse: bool = False) -> List[WorkshopResult]:
-        page_result = BeautifulSoup(
-            cls._request(cls.index_query, term),
-            "html.parser",
-        ).find_all("div", class_="workshopItem")
+        page_result = LexborHTMLParser(cls._request(cls.index_query, term).content).css(
+            "div.workshopItem"
+        )
 
         results = []
         for r in page_result:
             try:
-                item_title = r.find("div", class_="workshopItemTitle").get_text()
-                author_name = r.find("div", class_="workshopItemAuthorName").get_text()[
-                    3:
-                ]
+                item_title = r.css_first("div.workshopItemTitle").text()
+                author_name = r.css_first("div.workshopItemAuthorName").text()[3:]
                 steamid = int(
-                    re.search(r"\d+", r.find("a", class_="ugc")["href"]).group()
+                    STEAMID_EXP.search(r.css_first("a.ugc").attributes["href"]).group()
                 )
             except (AttributeError, ValueError):
                 continue
@@ -12,7 +12,7 @@ def platform() -> Optional[str]:
     return sys.platform
 
 
-def execute(cmd) -> Generator[str, None, None]:
+def execute(cmd: List[str], env: Optional[dict] = None) -> Generator[str, None, None]:
     with subprocess.Popen(
         cmd,
         stdout=subprocess.PIPE,
@@ -20,19 +20,12 @@ def execute(cmd) -> Generator[str, None, None]:
         universal_newlines=True,
         text=True,
         close_fds=True,
-        shell=True,
+        env=env,
     ) as proc:
-        for line in iter(proc.stdout.readline, b""):
+        for line in iter(proc.stdout.readline, ""):
             yield line
-            if (r := proc.poll()) is not None:
-                if r != 0:
-                    raise subprocess.CalledProcessError(r, cmd)
-                break
-
-
-def run_sh(cmd: str) -> str:
-    # Will raise a CalledProcessError if non-zero return code
-    return subprocess.check_output(cmd, text=True, shell=True).strip()
+        if (r := proc.wait()) != 0:
+            raise subprocess.CalledProcessError(r, cmd)
 
 
 def copy(source: Path, destination: Path, recursive: bool = False):
@@ -63,20 +56,17 @@ def list_loop_exclusion(a: list, b: list) -> list:
 
 
 def list_grab(element: str, root: ET.Element) -> Optional[List[str]]:
-    try:
-        return cast(
-            Optional[List[str]],
-            [n.text for n in cast(ET.Element, root.find(element)).findall("li")],
-        )
-    except AttributeError:
+    node = root.find(element)
+    if node is None:
         return None
+    return cast(List[str], [n.text for n in node.iterfind("li")])
 
 
 def element_grab(element: str, root: ET.Element) -> Optional[str]:
-    try:
-        return cast(ET.Element, root.find(element)).text
-    except AttributeError:
+    node = root.find(element)
+    if node is None:
         return None
+    return node.text
 
 
 def et_pretty_xml(root: ET.Element) -> str:
@@ -0,0 +1,59 @@
+import pytest
+
+from rmm.mod import Mod
+
+
+@pytest.mark.parametrize(
+    "xml, expected",
+    [
+        (
+            "<M><packageId>first</packageId><packageId>second</packageId></M>",
+            {"packageId": "first"},
+        ),
+        (
+            "<M><name>pre<b>child</b>tail</name><loadBefore><li>a<q>b</q>c</li>"
+            "</loadBefore></M>",
+            {"name": "pre", "loadBefore": ["a"]},
+        ),
+        (
+            "<M><!-- c --><packageId>a<!-- c -->b</packageId>"
+            "<loadAfter><li>x</li><!-- c --><li> y </li><li/></loadAfter></M>",
+            {"packageId": "ab", "loadAfter": ["x", " y ", None]},
+        ),
+        (
+            "<!DOCTYPE M [<!ENTITY e 'ent'>]><M><name>&e; &amp; more</name>"
+            "<author><![CDATA[x<y]]></author></M>",
+            {"name": "ent & more", "author": "x<y"},
+        ),
+        (
+            "﻿<?xml version='1.0' encoding='utf-8'?><M><name>Ünï</name></M>",
+            {"name": "Ünï"},
+        ),
+        (
+            "<M><authors>\n<li>A</li>\n<li>B</li></authors><author></author>"
+            "<supportedVersions><li>1.3</li><li>1.4</li></supportedVersions>"
+            "<incompatibleWith><li>bad.mod</li></incompatibleWith></M>",
+            {
+                "authors": ["A", "B"],
+                "author": None,
+                "supportedVersions": ["1.3", "1.4"],
+                "incompatibleWith": ["bad.mod"],
+            },
+        ),
+        (
+            "<M><modDependencies><li><packageId>dep</packageId></li>"
+            "</modDependencies><x><name>deep</name></x></M>",
+            {},
+        ),
+    ],
+)
+def test_read_about(tmp_path, xml, expected):
+    path = tmp_path / "About.xml"
+    path.write_bytes(xml.encode("utf-8"))
+    assert Mod.read_about(path) == expected
+
+
+def test_create_from_path_invalid_xml(tmp_path):
+    (tmp_path / "About").mkdir()
+    (tmp_path / "About" / "About.xml").write_text("<ModMetaData><name>")
+    assert Mod.create_from_path(tmp_path) is None
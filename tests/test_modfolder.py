@@ -0,0 +1,136 @@
+import os
+import shutil
+
+import pytest
+
+from rmm.mod import Mod, ModFolder
+
+ABOUT_XML = """<?xml version="1.0" encoding="utf-8"?>
+<ModMetaData>
+    <name>{name}</name>
+    <author>Spoons</author>
+    <packageId>spoons.test</packageId>
+</ModMetaData>
+"""
+
+
+def touch(path, offset):
+    # Explicit, distinct mtimes so changes are seen regardless of the
+    # timestamp granularity of the filesystem.
+    t = os.stat(path).st_mtime_ns + offset * 10**9
+    os.utime(path, ns=(t, t))
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        ModFolder, "cache_path", tmp_path / "cache" / "rmm" / "mods.json"
+    )
+    return ModFolder.cache_path
+
+
+@pytest.fixture
+def mods_dir(tmp_path):
+    about = tmp_path / "mods" / "test" / "About"
+    about.mkdir(parents=True)
+    (about / "About.xml").write_text(ABOUT_XML.format(name="Test Mod"))
+    (about / "PublishedFileId.txt").write_text("111")
+    return tmp_path / "mods"
+
+
+@pytest.fixture
+def parsed(monkeypatch):
+    calls = []
+    create_from_path = Mod.create_from_path
+
+    def counting(path, listing=None):
+        calls.append(path.name)
+        return create_from_path(path, listing)
+
+    monkeypatch.setattr(Mod, "create_from_path", staticmethod(counting))
+    return calls
+
+
+def read_one(path):
+    mods = ModFolder.read(path)
+    assert len(mods) == 1
+    return mods[0]
+
+
+def test_cache_hit(cache, mods_dir, parsed):
+    first = read_one(mods_dir)
+    assert cache.is_file()
+    assert parsed == ["test"]
+
+    second = read_one(mods_dir)
+    assert parsed == ["test"]
+    assert second.to_dict() == first.to_dict()
+
+
+def test_cache_miss_lists_once(cache, mods_dir, monkeypatch):
+    listed = []
+    scan_dir = Mod.scan_dir
+
+    def counting(path):
+        listed.append(os.path.basename(path))
+        return scan_dir(path)
+
+    monkeypatch.setattr(Mod, "scan_dir", staticmethod(counting))
+    read_one(mods_dir)
+    assert listed == ["test", "About"]
+
+
+def test_cache_about_xml_change(cache, mods_dir, parsed):
+    read_one(mods_dir)
+    about_xml = mods_dir / "test" / "About" / "About.xml"
+    about_xml.write_text(ABOUT_XML.format(name="Edited"))
+    touch(about_xml, 1)
+
+    assert read_one(mods_dir).name == "Edited"
+    assert parsed == ["test", "test"]
+
+
+def test_cache_steamid_change(cache, mods_dir, parsed):
+    assert read_one(mods_dir).steamid == 111
+    steamid = mods_dir / "test" / "About" / "PublishedFileId.txt"
+    steamid.write_text("222")
+    touch(steamid, 1)
+
+    assert read_one(mods_dir).steamid == 222
+
+
+def test_cache_ignore_change(cache, mods_dir, parsed):
+    assert not read_one(mods_dir).ignored
+    mod_dir = mods_dir / "test"
+    mtime = os.stat(mod_dir).st_mtime_ns
+    (mod_dir / ".rmm_ignore").write_text("")
+    # Keep the directory mtime so only .rmm_ignore itself can invalidate it.
+    os.utime(mod_dir, ns=(mtime, mtime))
+
+    assert read_one(mods_dir).ignored
+    assert parsed == ["test", "test"]
+
+
+def test_cache_version_mismatch(cache, mods_dir, parsed, monkeypatch):
+    read_one(mods_dir)
+    monkeypatch.setattr(ModFolder, "CACHE_VERSION", ModFolder.CACHE_VERSION + 1)
+
+    read_one(mods_dir)
+    assert parsed == ["test", "test"]
+
+
+def test_cache_prunes_missing_folders(cache, mods_dir, tmp_path):
+    other = tmp_path / "other"
+    shutil.copytree(mods_dir, other)
+    read_one(other)
+    read_one(mods_dir)
+    assert str(other) in ModFolder.read_cache()
+
+    shutil.rmtree(other)
+    read_one(mods_dir)
+    assert set(ModFolder.read_cache()) == {str(mods_dir)}
+
+
+def test_no_cache(cache, mods_dir):
+    assert len(ModFolder.read(mods_dir, use_cache=False)) == 1
+    assert not cache.exists()
@@ -0,0 +1,27 @@
+from rmm.mod import Mod
+from rmm.modlist import ModListFile, ModListV2Format
+
+
+def test_v2_round_trip_without_steamid_or_repo_url(tmp_path):
+    path = tmp_path / "modlist.csv"
+    assert ModListFile.write(path, [Mod(packageid="a")], ModListV2Format())
+    assert path.read_text() == "a,,\n"
+
+    (mod,) = ModListFile.read(path)
+    assert mod.packageid == "a"
+    assert mod.steamid is None
+    assert mod.repo_url is None
+
+
+def test_v2_round_trip(tmp_path):
+    path = tmp_path / "modlist.csv"
+    mods = [Mod(packageid="b,c", steamid=123, repo_url="https://example.com/r")]
+    ModListFile.write(path, mods, ModListV2Format())
+    assert path.read_text() == '"b,c",123,https://example.com/r\n'
+
+    (mod,) = ModListFile.read(path)
+    assert (mod.packageid, mod.steamid, mod.repo_url) == (
+        "b,c",
+        123,
+        "https://example.com/r",
+    )
@@ -0,0 +1,83 @@
+import threading
+
+import pytest
+import requests
+
+from rmm.steam import WorkshopResult, WorkshopWebScraper
+
+
+@pytest.fixture
+def details(monkeypatch):
+    failing = set()
+
+    def detail(cls, steamid):
+        if steamid in failing:
+            raise requests.ConnectionError(f"no route to {steamid}")
+        return WorkshopResult(
+            steamid,
+            size="1.2 MB",
+            create_time="Jan 1",
+            update_time="Feb 2",
+            rating="4",
+        )
+
+    monkeypatch.setattr(WorkshopWebScraper, "detail", classmethod(detail))
+    return failing
+
+
+def test_get_details_merges(details):
+    result = WorkshopResult(1, name="Harmony", author="brrainz")
+    assert result.get_details() is result
+    assert result.name == "Harmony"
+    assert result.author == "brrainz"
+    assert result.size == "1.2 MB"
+    assert result.create_time == "Jan 1"
+    assert result.update_time == "Feb 2"
+    assert result.rating == "4"
+    assert result.description is None
+
+
+def test_detail_batch(details):
+    results = [WorkshopResult(n, name=f"mod {n}", author="me") for n in range(50)]
+    batch = WorkshopWebScraper.detail_batch(results, concurrency=100)
+    assert [r.steamid for r in batch] == list(range(50))
+    assert all(a is b for a, b in zip(batch, results))
+    assert all(r.size == "1.2 MB" and r.name == f"mod {r.steamid}" for r in batch)
+
+
+def test_detail_batch_failed_fetch(details, capsys):
+    details.add(2)
+    results = [WorkshopResult(n, name=f"mod {n}") for n in range(1, 4)]
+    batch = WorkshopWebScraper.detail_batch(results)
+
+    assert [r.steamid for r in batch] == [1, 2, 3]
+    assert batch[0].rating == "4" and batch[2].rating == "4"
+    assert batch[1].name == "mod 2"
+    assert batch[1].rating is None
+    assert "Unable to fetch details for 2" in capsys.readouterr().out
+
+
+def test_detail_batch_sessions(monkeypatch):
+    sessions = set()
+    served = set()
+    barrier = threading.Barrier(4, timeout=5)
+
+    def get(session, url, **kwargs):
+        sessions.add(id(session))
+        # Hold the first requests until several threads are running, so the
+        # batch cannot be served by a single worker.
+        if len(served) < 4:
+            served.add(url)
+            barrier.wait()
+        assert session.adapters["https://"] is WorkshopWebScraper.adapter
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b"<html></html>"
+        return response
+
+    monkeypatch.setattr(requests.Session, "get", get)
+    results = [WorkshopResult(n, name=f"mod {n}") for n in range(20)]
+    batch = WorkshopWebScraper.detail_batch(results, concurrency=4)
+
+    assert [r.name for r in batch] == [f"mod {n}" for n in range(20)]
+    assert len(sessions) == 4
@@ -0,0 +1,26 @@
+import subprocess
+import sys
+
+import pytest
+
+import rmm.util as util
+
+
+def test_execute_yields_all_lines():
+    cmd = [sys.executable, "-c", "for n in range(100): print(n)"]
+    assert list(util.execute(cmd)) == [f"{n}\n" for n in range(100)]
+
+
+def test_execute_merges_stderr():
+    cmd = [sys.executable, "-c", "import sys; sys.stderr.write('err\\n')"]
+    assert list(util.execute(cmd)) == ["err\n"]
+
+
+def test_execute_raises_on_non_zero_exit():
+    cmd = [sys.executable, "-c", "print('a'); print('b'); raise SystemExit(3)"]
+    lines = []
+    with pytest.raises(subprocess.CalledProcessError) as e:
+        for line in util.execute(cmd):
+            lines.append(line)
+    assert e.value.returncode == 3
+    assert lines == ["a\n", "b\n"]